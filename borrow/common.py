@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import math
 from typing import Tuple, TypeVar
 
 
@@ -15,22 +16,28 @@ def sanitize_percent(value: NumStr) -> Numeric:
       string or decimal form.
 
     Return:
-      - float: if string depicts percentage.
+      - float: if string provided, as a decimal
+      when it depicts a percentage.
       - Numeric: if Numeric provided."""
 
+    # Numeric values are already
+    # in decimal form
+    #
+    if isinstance(value, (int, float)):
+        return value
+
     # Strip whitespace from strings
     #
-    if (type(value) is str):
-        value = value.strip()
+    value = value.strip()
 
     # If value endswith a percent
     # symbol then transform to 
     # percentage decimal
     #
-    if value[-1] == '%':
-        value = float(value[:-1]) / 100
+    if value.endswith('%'):
+        return float(value[:-1]) / 100
 
-    return value
+    return float(value)
 
 
 def sign_magnitude(value: NumStr) -> Tuple[Numeric, Numeric]:
@@ -47,32 +54,39 @@ def sign_magnitude(value: NumStr) -> Tuple[Numeric, Numeric]:
         - Numeric: sign (+/-) of input.
         - Numeric: absolute value of input."""
 
-    # Default values:
-    # +<value>
-    #
-    sign = 1.0 
-    value = value
-
     # If numeric return sign multiplier
-    # and absolute value for magnitude
+    # and absolute value for magnitude,
+    # zero is treated as positive
     #
-    if (type(value) in [float, int]):
-        if (value < 0):
-            sign = -1.0
-        value = abs(value)
+    if isinstance(value, (int, float)):
+        return (math.copysign(1.0, value) if value else 1.0, abs(value))
 
     # If string check first character
     # for sign and strip it for magnitude
     #
-    else:
-        if (value[0] in ['+', '-']):
-            if (value[0] == '-'):
-                sign = -1.0
-            value = value[1:]
+    sign = -1.0 if (value[0] == '-') else 1.0
+
+    if (value[0] in '+-'):
+        value = value[1:]
 
     return (sign, value)
 
 
+def to_pence(value: Numeric) -> int:
+
+    """Converts a currency amount into whole
+    pence.
+
+    Arguments:
+      - value (Numeric): amount in pounds.
+
+    Return:
+      - int: amount in pence, rounded to the
+      nearest penny."""
+
+    return round(value * 100)
+
+
 def signed_float_to_string(sign: Numeric, magnitude: Numeric) -> Tuple[str, str]:
 
     """Translates sign and magnitude tuple
@@ -3,17 +3,46 @@ import yaml
 from borrow.common import *
 from borrow.mortgage import mortgage
 from datetime import date, datetime
-from dateutil.rrule import rrule
 from dateutil.relativedelta import relativedelta
 from typing import List, NewType
 
+# Prefer the libyaml backed
+# loader where it is available
+#
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# First payment is a
+# month after the start
+#
+_ONE_MONTH = relativedelta(months=1)
+
+# Borders of the printed
+# loan summary
+#
+_SUMMARY_HEADER = """
+
+
++============================================+
+|           LOAN REPAYMENT SUMMARY           |
++============================================+
+
+"""
+
+_SUMMARY_FOOTER = """
++============================================+
+
+        """
+
 Mortgage = NewType('Mortgage', mortgage)
 
 class loan(object):
 
     def __init__(self, amount: Numeric, start: datetime, filename: str):
-        self.amount      = amount
-        self.outstanding = amount
+        self.amount      = to_pence(amount)
+        self.outstanding = self.amount
         self.cost        = "Unknown"
         self.start       = start
         self.mortgages   = self.load_mortgages(filename)
@@ -27,33 +56,21 @@ class loan(object):
 
         # Trim outstanding to 2 d.p.
         #
-        (sign, outstanding) = sign_magnitude(self.outstanding)
+        (sign, outstanding) = sign_magnitude(self.outstanding / 100)
         (sign, outstanding) = signed_float_to_string(sign, outstanding)
 
+        commencement = self.start.strftime("%d %b  '%y")
+
         # Pad everything to 10 chars
         #
-        return ("""
+        body = f"""    Total amount      :  £{self.amount / 100:10.2f}
+    Amount outstanding: {sign}£{outstanding:>10}
+    Loan cost to date :  £{self.cost / 100:10.2f}
+    Loan commencement :  {commencement}
+    Repayment duration:  {self.duration.years:2} years {self.duration.months:2} months
+"""
 
-
-+============================================+
-|           LOAN REPAYMENT SUMMARY           |
-+============================================+
-
-    Total amount      :  £{0:10.2f}
-    Amount outstanding: {1}£{2:>10}
-    Loan cost to date :  £{3:10.2f}
-    Loan commencement :  {4}
-    Repayment duration:  {5:2} years {6:2} months
-
-+============================================+
-
-        """.format(self.amount,
-                   sign,
-                   outstanding,
-                   self.cost,
-                   self.start.strftime("%d %b  '%y"),
-                   self.duration.years,
-                   self.duration.months))
+        return "".join([_SUMMARY_HEADER, body, _SUMMARY_FOOTER])
 
 
     def load_mortgages(self, filename: str) -> List[Mortgage]:
@@ -92,7 +109,7 @@ class loan(object):
         # details from file
         #
         with open(filename, 'r') as file:
-            mortgages = yaml.safe_load(file)
+            mortgages = yaml.load(file, Loader=_Loader)
 
         for m in mortgages.keys():
 
@@ -150,7 +167,7 @@ class loan(object):
         # First payment is in the
         # second month
         #
-        paydate = start + relativedelta(months=1)
+        paydate = start + _ONE_MONTH
         paydatestr = paydate.strftime("%d %b '%y")
 
         print("""
@@ -164,11 +181,10 @@ class loan(object):
         # pay off oustanding and update
         # metrics
         #
-        while (self.mortgages):
+        for m in self.mortgages:
 
             # Repay mortgages in order
             #
-            m = self.mortgages.pop(0)
             (increase, decrease, current) = m.repay(self.outstanding, start)
 
             # Update outstanding capital,
@@ -178,11 +194,6 @@ class loan(object):
             self.cost        += increase
             self.end          = current
 
-            # Once paid off print
-            # overall metrics
-            #
-            self.duration = relativedelta(self.end, self.start)
-            
             # Stop repaying when
             # outstanding is zero
             #
@@ -191,3 +202,9 @@ class loan(object):
             else:
                 start = current
 
+        # Once paid off print
+        # overall metrics
+        #
+        if self.mortgages:
+            self.duration = relativedelta(self.end, self.start)
+
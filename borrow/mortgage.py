@@ -1,21 +1,125 @@
 #!/usr/bin/env python3
+import sys
 from datetime import date, datetime
-from dateutil.rrule import rrule, MONTHLY, YEARLY
-from dateutil.relativedelta import relativedelta
-from typing import Tuple
+from calendar import monthrange
+from typing import Dict, List, Tuple
 from borrow.common import *
 
+
+# Month abbreviations for payment
+# dates, avoids strftime per month
+#
+_MONTH_ABBR = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# Border of the printed
+# mortgage details
+#
+_DETAILS_HEADER = """
++======  COMMENCING MORTGAGE DETAILS  =======+
+        
+"""
+
+
+def _amortize(outstanding: Numeric, monthly_rate: float, repayment: Numeric,
+              overpay: Numeric, months: int) -> Tuple[Numeric, Numeric, int, List[Numeric], Dict[int, Tuple[Numeric, Numeric]]]:
+
+    """Amortizes the amount owed month by month.
+
+    Arguments:
+      - outstanding (int): Amount owed in pence at
+      the start of the term.
+      - monthly_rate (float): Interest rate applied
+      each month.
+      - repayment (int): Monthly repayment in pence.
+      - overpay (Numeric): Fraction of the amount
+      owed to overpay on each anniversary.
+      - months (int): Number of repayments in term.
+
+    Return:
+      - Tuple:
+        - Numeric: Amount of interest accrued.
+        - Numeric: Amount repaid.
+        - int: Index of the final month.
+        - List: Amount owed after each repayment.
+        - Dict: Overpayment and new balance keyed
+        by month index.
+
+    Details:
+    Purely numeric so that the repayment schedule
+    can be computed without any printing. Interest
+    and overpayments are rounded to the nearest
+    penny so amounts stay in whole pence. Stops
+    early once the amount owed is paid in full.
+    Month m is the (m + 1)th repayment, so the
+    yearly overpayment falls on each m where
+    m % 12 == 10, a month before the anniversary."""
+
+
+    interests    = 0
+    repayments   = 0
+    balances     = []
+    overpayments = {}
+    lump         = round(outstanding * overpay)
+    last         = months - 1
+
+    for m in range(months):
+
+        # Add on monthly interest
+        #
+        interest     = round(outstanding * monthly_rate)
+        interests   += interest
+        outstanding += interest
+
+        # While amount outstanding
+        # update remaining and paid
+        #
+        if not (outstanding > 0):
+            last = m
+            break
+
+        paid         = repayment if (outstanding > repayment) else outstanding
+        repayments  += paid
+        outstanding -= paid
+        balances.append(outstanding)
+
+        # Foreach year anniversary
+        # repay lump sum off the
+        # outstanding amount
+        #
+        if overpay and (m % 12 == 10):
+            paid         = lump if (outstanding > lump) else outstanding
+            repayments  += paid
+            outstanding -= paid
+            lump         = round(outstanding * overpay)
+
+            if paid:
+                overpayments[m] = (paid, outstanding)
+
+    return (interests, repayments, last, balances, overpayments)
+
+
 class mortgage(object):
 
     def __init__(self, rate: str, duration: int, repayment: Numeric, overpay: NumStr, downpayment: NumStr):
         self.amount      = "Unknown"
-        self.rate        = rate
-        self.repayment   = repayment
-        self.overpay     = overpay
-        self.lump        = 0
-        self.duration    = duration
+        self.rate        = float(rate)
+        self.repayment   = to_pence(float(repayment))
+        self.overpay     = float(overpay)
+        self.duration    = int(duration)
         self.downpayment = downpayment
         self.start       = "N/A"
+        self._monthly_rate = self.rate / 12
+
+        # Resolve the downpayment sign and
+        # whether it is a percentage once
+        # rather than on every repay or print
+        #
+        (sign, magnitude) = sign_magnitude(downpayment)
+
+        self._downpayment_sign = int(sign)
+        self._downpayment_pct  = isinstance(magnitude, str) and magnitude.strip().endswith('%')
+        self._downpayment_val  = sanitize_percent(magnitude) if self._downpayment_pct else to_pence(float(magnitude))
 
 
     # What to display when the
@@ -24,70 +128,77 @@ class mortgage(object):
     def __str__(self) -> str:
 
         # Determine how to draw downpay as
-        # a string. If it's a string then
-        # it must be a percentage so also
-        # print a percent sign afterwards
+        # a string. If it's a percentage
+        # also print a percent sign afterwards
         #
-        (sign, downpayment) = sign_magnitude(self.downpayment)
-
-        if type(downpayment) is not str:
-            (sign, downpayment) = signed_float_to_string(sign, downpayment)
+        if not self._downpayment_pct:
+            (sign, downpayment) = signed_float_to_string(self._downpayment_sign,
+                                                         self._downpayment_val / 100)
             percent = " "
         else:
-            sign = "-" if sign < 0 else " "
-            downpayment = "{0:.2f}".format(float(downpayment[:-1]))
+            sign = "-" if self._downpayment_sign < 0 else " "
+            downpayment = f"{self._downpayment_val * 100:.2f}"
             percent = "%"
 
+        commencing = f"{_MONTH_ABBR[self.start.month - 1]} '{self.start.year % 100:02d}"
+
         # Pad everything to 10 chars
         #
-        return ("""
-+======  COMMENCING MORTGAGE DETAILS  =======+
-        
-    Amount     :  £{0:10.2f}
-    Downpayment: {1}£{2:>10}{3}
-    Repayment  :  £{4:10.2f}  per month
-    Overpayment:   {5:10.2f}% per year
-    Interest   :   {6:10.2f}% for {7} years
+        body = f"""    Amount     :  £{self.amount / 100:10.2f}
+    Downpayment: {sign}£{downpayment:>10}{percent}
+    Repayment  :  £{self.repayment / 100:10.2f}  per month
+    Overpayment:   {self.overpay * 100:10.2f}% per year
+    Interest   :   {self.rate * 100:10.2f}% for {self.duration} years
 
-+==========  Commencing:  {8}  ==========+
+"""
 
-""".format(self.amount,
-           sign,
-           downpayment,
-           percent,
-           self.repayment,
-           self.overpay * 100,
-           self.rate * 100,
-           self.duration,
-           self.start.strftime("%b '%y")))
+        return "".join([_DETAILS_HEADER, body, f"+==========  Commencing:  {commencing}  ==========+\n\n"])
 
 
-    def repayment_duration(self) -> datetime:
+    def repayment_duration(self) -> range:
 
-        """Iterator of payment dates during the
-        mortgage term.
+        """Payment months during the mortgage
+        term.
 
         Arguments:
           - None.
 
         Return:
-          - datetime: Next mortgage payment date.
+          - range: Months since the start of the
+          term on which payments are made.
 
         Details:
-        Uses relativedelta and rrule to provide
-        monthly payment dates starting from a
-        month after the mortgage term starts for
-        the specified number of years."""
+        Payments start a month after the mortgage
+        term starts and run for the specified
+        number of years. Use payment_date to turn
+        a month into a date."""
 
 
-        # Iterator: for the duration
-        # of the term of the mortgage
-        # return a payment date object
-        #
-        end   = self.start + relativedelta(years=self.duration) - relativedelta(months=1)
-        start = self.start + relativedelta(months=1)
-        for current in rrule(freq=MONTHLY, dtstart=start, until=end):
-            yield current
+        return range(1, self.duration * 12)
+
+
+    def payment_date(self, month: int) -> datetime:
+
+        """Date of a payment month.
+
+        Arguments:
+          - month (int): Months since the start of
+          the term.
+
+        Return:
+          - datetime: Payment date.
+
+        Details:
+        Uses integer year/month arithmetic. The day
+        is clamped to the end of shorter months."""
+
+
+        months = self.start.month - 1 + month
+        year   = self.start.year + (months // 12)
+        month  = (months % 12) + 1
+        day    = min(self.start.day, monthrange(year, month)[1])
+
+        return self.start.replace(year=year, month=month, day=day)
 
 
     def repay(self, outstanding: Numeric, start: datetime) -> Tuple[Numeric, Numeric, datetime]:
@@ -96,15 +207,15 @@ class mortgage(object):
         the duration of the mortgage term.
 
         Arguments:
-          - outstanding (Numeric): Amount owed.
+          - outstanding (int): Amount owed in pence.
           - start (datetime): Date repayments start.
 
         Return:
           - Tuple:
-            - Numeric: Amount of interest accrued
-            during the mortgage term.
-            - Numeric: Amount repaid during the
-            mortgage term.
+            - int: Amount of interest accrued in
+            pence during the mortgage term.
+            - int: Amount repaid in pence during
+            the mortgage term.
             - datetime: Mortgage repayment end date.
 
         Details:
@@ -121,8 +232,6 @@ class mortgage(object):
 
         self.start  = start
         self.amount = outstanding
-        interests   = 0
-        repayments  = 0
 
         # Determine downpayment and
         # substract from the outstanding
@@ -136,180 +245,110 @@ class mortgage(object):
         downpayment  = self.calculate_downpayment(outstanding)
         outstanding -= downpayment 
 
-        # Print mortgage details
+        # Amortize for the duration
+        # of the mortgage and only
+        # then print the schedule
         #
-        print(self)
+        months = self.repayment_duration()
+        (interests,
+         repayments,
+         last,
+         balances,
+         overpayments) = _amortize(outstanding,
+                                   self._monthly_rate,
+                                   self.repayment,
+                                   self.overpay,
+                                   len(months))
 
-        if self.overpay:
-            self.lump = outstanding * self.overpay
-        
-        # If downpayment exists then
-        # determine how to print it
-        # and do so
-        #
-        if (downpayment):
-            (sign, dpayment) = sign_magnitude(downpayment)
-            (sign, dpayment) = signed_float_to_string(sign, dpayment)
-
-            print("""---   Downpayment({0}): {1}£{2:>10}   ---
-                  """.format(start.strftime("%b '%y"), sign, dpayment))
-
-        # For durartion
-        # of the mortgage
-        #
-        for date in self.repayment_duration():
-
-            # Add on monthly interest
-            #
-            interest     = self.calculate_interest(outstanding)
-            interests   += interest
-            outstanding += interest
+        self._print_schedule(downpayment, balances, overpayments)
 
-            # While amount outstanding
-            # update remaining and paid 
-            #
-            if (outstanding > 0):
-                repayment    = self.calculate_repayment(date, outstanding)
-                repayments  += repayment
-                outstanding -= repayment
-            else:
-                break
-
-            # If overpay specified
-            # then calculate the amount
-            #
-            if self.overpay:
-                overpayment  = self.calculate_overpay(date, outstanding)
-                repayments  += overpayment
-                outstanding -= overpayment
+        return (interests, repayments + downpayment, self.payment_date(months[last]))
 
-        return (interests, repayments + downpayment, date)
 
+    def _print_schedule(self, downpayment: Numeric,
+                        balances: List[Numeric], overpayments: Dict[int, Tuple[Numeric, Numeric]]) -> None:
 
-    def calculate_downpayment(self, outstanding: Numeric) -> Numeric:
-
-        """Calculates downpayment amount at the beginning
-        of the mortgage term.
+        """Prints the mortgage details and the
+        repayment schedule.
 
         Arguments:
-          - outstanding (Numeric): Amount owed.
+          - downpayment (Numeric): Amount paid upfront.
+          - balances (List): Amount owed after each
+          repayment.
+          - overpayments (Dict): Overpayment and new
+          balance keyed by month index.
 
         Return:
-          - Numeric: Amount paid upfront, before the 
-          mortgage term begins.
+          - None.
 
         Details:
-        Downpayment can be negative which indicates that
-        the downpayment amount is paid to the customer
-        in event of capital release at beginning of term."""
+        Output is buffered and written once rather
+        than printed line by line. Payment dates
+        are only built for the months printed."""
 
 
-        (sign, magnitude) = sign_magnitude(self.downpayment)
-
-        # Determine magnitude of amount if
-        # the initial is a percentage
+        # Mortgage details
         #
-        if ((type(magnitude) is str) and (magnitude[-1] == '%')):
-            magnitude = sanitize_percent(magnitude) * float(outstanding)
+        lines = [str(self)]
 
-        # Factor in sign of the payment
-        # from earlier
+        # If downpayment exists then
+        # determine how to print it
         #
-        return (magnitude * sign)
-
-
-
-    def calculate_repayment(self, date: datetime, outstanding: Numeric) -> Numeric:
-
-        """Calculates repayment associated with
-        amount owed.
-
-        Arguments:
-          - date (datetime): Date of repayment.
-          - outstanding (Numeric): Amount owed.
-
-        Return:
-          - Numeric: Amount to repay at date.
+        if (downpayment):
+            (sign, dpayment) = sign_magnitude(downpayment / 100)
+            (sign, dpayment) = signed_float_to_string(sign, dpayment)
 
-        Details:
-        Ensures only amount owed is paid. Prints
-        outstanding amout. Repayments also take
-        into account overpayments."""
+            commencing = f"{_MONTH_ABBR[self.start.month - 1]} '{self.start.year % 100:02d}"
 
+            lines.append(f"""---   Downpayment({commencing}): {sign}£{dpayment:>10}   ---
+                  """)
 
-        # Calculate standard monthly
-        # repayment based on amount
-        # remaining or monthly amount
-        #
-        repayment = self.repayment if (outstanding > self.repayment) else outstanding
+        for (m, balance) in enumerate(balances):
+            date    = self.payment_date(m + 1)
+            datestr = f"{_MONTH_ABBR[date.month - 1]} '{date.year % 100:02d}"
+            lines.append(f"      {datestr} - Outstanding: £{balance / 100:10.2f}")
 
-        print("      {0} - Outstanding: £{1:10.2f}".format(date.strftime("%b '%y"), 
-                                                           (outstanding - repayment)))
+            # Print overpayment to 2 d.p.
+            #
+            if m in overpayments:
+                (lump, after_lump) = overpayments[m]
+                spacing = "\n\n" if after_lump else ""
+                lines.append(f"""
+---   {datestr} Overpayment: £{lump / 100:10.2f}   ---
+              New balance: £{after_lump / 100:10.2f}{spacing}""")
 
-        return repayment
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
 
-    def calculate_overpay(self, date: datetime, outstanding: Numeric) -> Numeric:
+    def calculate_downpayment(self, outstanding: Numeric) -> Numeric:
 
-        """Calculates amount to overpay based on
-        amount owed.
+        """Calculates downpayment amount at the beginning
+        of the mortgage term.
 
         Arguments:
-          - date (datetime): Current payment date.
-          - outstanding (Numeric): Amount owed.
+          - outstanding (int): Amount owed in pence.
 
         Return:
-          - Numeric: Amount of interest accumulated.
+          - int: Amount paid upfront in pence, before
+          the mortgage term begins.
 
         Details:
-        Uses relativedelta in order to determine
-        overpayment dates in a yearly cadence from
-        the initial mortgage date."""
+        Downpayment can be negative which indicates that
+        the downpayment amount is paid to the customer
+        in event of capital release at beginning of term.
+        Sign and magnitude are resolved in __init__."""
 
-        lump    = 0
-        paydate = self.start - relativedelta(months=1) 
 
-        # Foreach year anniversary
-        # of the mortgage calculate
-        # the amount to overpay by
+        # Determine magnitude of amount if
+        # the initial is a percentage
         #
-        if (date in [ d for d in rrule(freq=YEARLY, dtstart=paydate, count=(self.duration + 1))]):
-
-            # Repay lump sum off
-            # the oustanding amount
-            #
-            lump       = self.lump if (outstanding > self.lump) else outstanding
-            after_lump = outstanding - lump
-            self.lump  = after_lump * self.overpay
+        magnitude = self._downpayment_val
 
-            spacing    = "\n\n" if after_lump else ""
-
-            # Print overpayment to 2 d.p.
-            #
-            if lump:
-                print("""
----   {0} Overpayment: £{1:10.2f}   ---
-              New balance: £{2:10.2f}{3}""".format(date.strftime("%b '%y"), 
-                                                   lump,
-                                                   after_lump,
-                                                   spacing))
+        if self._downpayment_pct:
+            magnitude = round(magnitude * outstanding)
 
-        return lump
-
-
-    def calculate_interest(self, outstanding: Numeric) -> Numeric:
-
-        """Calculates interest associated with
-        amount owed.
-
-        Arguments:
-          - outstanding (Numeric): Amount owed.
-
-        Return:
-          - Numeric: Amount of interest accumulated."""
-
-
-        # calculate monthly interest
+        # Factor in sign of the payment
+        # from earlier
         #
-        return outstanding * (self.rate/12)
-
+        return (magnitude * self._downpayment_sign)